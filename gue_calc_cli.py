@@ -0,0 +1,203 @@
+"""Small command-line front end for :mod:`gue_calc_lib`.
+
+Each subcommand maps to one of the library helpers. Depth-style arguments
+accept either a single number (``100``) or a comma-separated list
+(``60,80,100``); lists are dispatched to the vectorised ``*_vec`` helpers so
+dive-table sweeps stay in NumPy rather than looping in Python.
+
+Startup is kept lean: the library (and NumPy behind it) is imported inside
+the command handlers, and only the requested subcommand's parser is built
+unless the full tree is needed for ``--help`` or error reporting.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+
+def _parse_depths(text: str):
+    """argparse type: a float, or an ``np.ndarray`` for comma lists.
+
+    Raising ValueError here lets argparse report malformed input as a clean
+    usage error instead of a traceback.
+    """
+    if ',' in text:
+        import numpy as np
+        return np.asarray([float(part) for part in text.split(',')], dtype=np.float64)
+    return float(text)
+
+
+# argparse names the type in its error message ("invalid depth value: ...").
+_parse_depths.__name__ = 'depth'
+
+
+def _is_batch(depth) -> bool:
+    return not isinstance(depth, float)
+
+
+def cmd_ata(args: argparse.Namespace) -> None:
+    import gue_calc_lib as g
+    depth = args.depth
+    if _is_batch(depth):
+        for d, ata in zip(depth, g.calcATA_vec(depth, water=args.water)):
+            print(f'{d:g} ft: {ata} ATA')
+    else:
+        print(g.calcATA(depth, water=args.water))
+
+
+def cmd_mod(args: argparse.Namespace) -> None:
+    import gue_calc_lib as g
+    print(g.calcMOD(args.f_o2, ppo2_limit=args.ppo2, water=args.water))
+
+
+def cmd_end(args: argparse.Namespace) -> None:
+    import gue_calc_lib as g
+    depth = args.depth
+    if _is_batch(depth):
+        for d, end in zip(depth, g.calcEND_vec(depth, args.f_he, water=args.water)):
+            print(f'{d:g} ft: END {end} ft')
+    else:
+        print(g.calcEND(depth, args.f_he, water=args.water))
+
+
+def cmd_ead(args: argparse.Namespace) -> None:
+    import gue_calc_lib as g
+    depth = args.depth
+    if _is_batch(depth):
+        for d, ead in zip(depth, g.calcEAD_vec(depth, args.f_o2, water=args.water)):
+            print(f'{d:g} ft: EAD {ead} ft')
+    else:
+        print(g.calcEAD(depth, args.f_o2, water=args.water))
+
+
+def cmd_min_gas(args: argparse.Namespace) -> None:
+    import gue_calc_lib as g
+    depth = args.depth
+    if _is_batch(depth):
+        for d in depth:
+            print(f'{d:g} ft: {g.calcMG(float(d), args.switch, c=args.scr)} cf')
+    else:
+        print(g.calcMG(depth, args.switch, c=args.scr))
+
+
+def cmd_tank(args: argparse.Namespace) -> None:
+    import gue_calc_lib as g
+    tank_info = g.tanks.get(args.tank)
+    if tank_info is None:
+        raise SystemExit(f'Unknown tank: {args.tank}; expected one of {list(g.tanks)}')
+    print(f"{args.tank}: {tank_info['rated_vol']} cf @ {tank_info['rated_PSI']} PSI, "
+          f"tank factor {tank_info['tf']}, "
+          f"min gas @ 100ft {tank_info['mg_psi_at_100ft']} PSI")
+
+
+def cmd_bottom_time(args: argparse.Namespace) -> None:
+    import gue_calc_lib as g
+    minutes = g.calcBottomTime(args.depth, tank=args.tank, method=args.method, scr=args.scr)
+    print(f'{minutes:.1f}')
+
+
+def _register_ata(sub) -> None:
+    p = sub.add_parser('ata', help='ambient pressure (ATA) at depth')
+    p.add_argument('depth', type=_parse_depths,
+                   help='depth in feet, or comma list for a table')
+    p.add_argument('--water', choices=['salt', 'fresh'], default='salt')
+    p.set_defaults(func=cmd_ata)
+
+
+def _register_mod(sub) -> None:
+    p = sub.add_parser('mod', help='maximum operating depth for a mix')
+    p.add_argument('f_o2', type=float, help='oxygen fraction, e.g. 0.32')
+    p.add_argument('--ppo2', type=float, default=1.4)
+    p.add_argument('--water', choices=['salt', 'fresh'], default='salt')
+    p.set_defaults(func=cmd_mod)
+
+
+def _register_end(sub) -> None:
+    p = sub.add_parser('end', help='equivalent narcotic depth')
+    p.add_argument('depth', type=_parse_depths,
+                   help='depth in feet, or comma list for a table')
+    p.add_argument('f_he', type=float, help='helium fraction, e.g. 0.45')
+    p.add_argument('--water', choices=['salt', 'fresh'], default='salt')
+    p.set_defaults(func=cmd_end)
+
+
+def _register_ead(sub) -> None:
+    p = sub.add_parser('ead', help='equivalent air depth')
+    p.add_argument('depth', type=_parse_depths,
+                   help='depth in feet, or comma list for a table')
+    p.add_argument('f_o2', type=float, help='oxygen fraction, e.g. 0.32')
+    p.add_argument('--water', choices=['salt', 'fresh'], default='salt')
+    p.set_defaults(func=cmd_ead)
+
+
+def _register_min_gas(sub) -> None:
+    p = sub.add_parser('min_gas', help='minimum gas (CAT) in cubic feet')
+    p.add_argument('depth', type=_parse_depths,
+                   help='depth in feet, or comma list for a table')
+    p.add_argument('--switch', type=float, default=0, help='gas switch depth in feet')
+    p.add_argument('--scr', type=float, default=1.5, help='consumption in cf/min')
+    p.set_defaults(func=cmd_min_gas)
+
+
+def _register_tank(sub) -> None:
+    p = sub.add_parser('tank', help='show tank definition and tank factor')
+    p.add_argument('tank', help='tank name, e.g. AL80')
+    p.set_defaults(func=cmd_tank)
+
+
+def _register_bottom_time(sub) -> None:
+    p = sub.add_parser('bottom_time', help='estimated bottom time for a tank')
+    p.add_argument('depth', type=float, help='depth in feet')
+    p.add_argument('--tank', default='2xAL80')
+    p.add_argument('--method', choices=['ALL', 'HALF', 'THIRDS'], default='ALL')
+    p.add_argument('--scr', type=float, default=1.5)
+    p.set_defaults(func=cmd_bottom_time)
+
+
+_SUBCOMMANDS = {
+    'ata': _register_ata,
+    'mod': _register_mod,
+    'end': _register_end,
+    'ead': _register_ead,
+    'min_gas': _register_min_gas,
+    'tank': _register_tank,
+    'bottom_time': _register_bottom_time,
+}
+
+
+def build_parser(only: str | None = None) -> argparse.ArgumentParser:
+    """Build the argument parser.
+
+    When ``only`` names a known subcommand, just that subparser is
+    registered, skipping construction of the other six on the hot path.
+    """
+    parser = argparse.ArgumentParser(prog='gue_calc_cli.py',
+                                     description='GUE dive-planning calculations')
+    sub = parser.add_subparsers(dest='command', required=True)
+    if only in _SUBCOMMANDS:
+        _SUBCOMMANDS[only](sub)
+    else:
+        for register in _SUBCOMMANDS.values():
+            register(sub)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the CLI; ``argv`` defaults to ``sys.argv[1:]``.
+
+    Accepting an explicit argv lets tests invoke the CLI in-process instead
+    of forking an interpreter per case.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    # Known subcommand: build only its parser. Anything else (--help, a typo,
+    # no arguments) falls back to the full tree for proper help/errors.
+    only = argv[0] if argv else None
+    parser = build_parser(only)
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
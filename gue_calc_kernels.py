@@ -0,0 +1,120 @@
+"""Numba-compiled scalar kernels backing the hot paths in :mod:`gue_calc_lib`.
+
+The composite planning helpers (``calcMG``, ``calcBottomTime``) are pure float
+math spread over several small Python functions; JIT-compiling the fused
+arithmetic here removes the per-call frame and boxing overhead. Kernels take
+only plain floats — dict lookups (tank definitions, gas-partition methods)
+stay in the pure-Python wrappers where they belong.
+
+``cache=True`` persists the compiled machine code next to this file so the
+compile cost is paid once per machine, not once per process. Numba itself is
+optional: without it the kernels run as ordinary Python functions with
+identical results. ``fastmath`` is deliberately not used: the kernels are a
+handful of flops whose results get truncated with int(), and reassociation
+can flip the integer at exact whole-foot boundaries.
+"""
+
+from __future__ import annotations
+
+try:
+    from numba import njit
+except ImportError:  # numba is an optional accelerator; fall back to plain Python
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True)
+def _calc_ata(depth: float, factor: float) -> float:
+    """Unrounded ATA at depth for a given water factor (33.0 salt / 34.0 fresh).
+
+    The public calcATA rounds to 1 decimal with CPython's round(); Numba's
+    two-argument round() is not correctly rounded and would diverge from the
+    baseline (and from the no-numba fallback), so rounding stays out of here.
+    """
+    return (depth / factor) + 1.0
+
+
+@njit(cache=True)
+def _calc_mod(f_o2: float, ppo2_limit: float, factor: float) -> int:
+    """Maximum operating depth in feet for a given water factor."""
+    if f_o2 <= 0:
+        return 0
+    ata = ppo2_limit / f_o2
+    return int((ata - 1.0) * factor)
+
+
+@njit(cache=True)
+def _calc_end(depth: float, f_he: float, factor: float) -> int:
+    """Equivalent narcotic depth in feet for a given water factor."""
+    ata = (depth / factor) + 1.0
+    narcotic_ata = ata * (1.0 - f_he)
+    return int((narcotic_ata - 1.0) * factor)
+
+
+@njit(cache=True)
+def _calc_ead(depth: float, f_o2: float, factor: float) -> int:
+    """Equivalent air depth in feet for a given water factor."""
+    ata = (depth / factor) + 1.0
+    f_n2 = 1.0 - f_o2
+    # Divide by 0.79 rather than multiplying by a precomputed reciprocal: the
+    # last-bit difference flips the int() truncation (air at depth d would
+    # come out as d-1 ft with the multiply).
+    ead_ata = ata * (f_n2 / 0.79)
+    return int((ead_ata - 1.0) * factor)
+
+
+@njit(cache=True)
+def _dive_profile(depth: float, f_o2: float, f_he: float,
+                  ppo2_limit: float, factor: float) -> tuple:
+    """Fused MOD/END/EAD for one (depth, mix) tuple; ata is computed once.
+
+    Same expressions as the single kernels above, so the three results match
+    _calc_mod/_calc_end/_calc_ead exactly.
+    """
+    ata = (depth / factor) + 1.0
+    if f_o2 <= 0:
+        mod = 0
+    else:
+        mod = int(((ppo2_limit / f_o2) - 1.0) * factor)
+    end = int(((ata * (1.0 - f_he)) - 1.0) * factor)
+    ead = int(((ata * ((1.0 - f_o2) / 0.79)) - 1.0) * factor)
+    return mod, end, ead
+
+
+@njit(cache=True)
+def _calc_time_to_stop(depth: float, gas_switch_depth: float) -> int:
+    """Minutes to ascend to the surface or a gas switch (GUE heuristic).
+
+    Branchless: the bool folds in both the shortened ascent distance and the
+    extra minute for the switch, keeping the JIT code straight-line.
+    """
+    has_switch = gas_switch_depth > 0
+    return int(((depth - has_switch * gas_switch_depth) / 10.0) + 1 + has_switch)
+
+
+@njit(cache=True)
+def _calc_mg(ata_avg: float, depth: float, gas_switch_depth: float, c: float) -> int:
+    """Minimum Gas in whole cubic feet from a precomputed average ATA.
+
+    ``ata_avg`` is supplied by the wrapper from the 1-decimal-rounded calcATA
+    values, matching the baseline formula.
+    """
+    t = _calc_time_to_stop(depth, gas_switch_depth)
+    # mg is non-negative for physical inputs, so int(x + 0.5) is floor(x + 0.5)
+    # without the extra math.floor call.
+    return int((c * ata_avg * t) + 0.5)
+
+
+@njit(cache=True)
+def _calc_bottom_time(ata: float, mg_cf: float, tf: float, rated_psi: float,
+                      scr: float, method_divisor: float) -> float:
+    """Bottom time in minutes from resolved tank floats and method divisor.
+
+    ``ata`` and ``mg_cf`` come from the (rounded, cached) calcATA/calcMG
+    wrappers so the result matches the baseline arithmetic exactly.
+    """
+    mg_psi = int(mg_cf / tf) * 100
+    ug = (rated_psi - mg_psi) / method_divisor
+    return ug / (scr * ata)
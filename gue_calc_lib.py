@@ -6,18 +6,61 @@ they are easy to test and reuse.
 """
 
 from __future__ import annotations
-from typing import Iterable, Optional, Dict
+from enum import IntEnum
+from typing import Iterable, Optional, Dict, Union
+import functools
 import math
 
-# Tank definitions used by tests and notebook helpers.
-tanks: Dict[str, Dict[str, int]] = {
-    'AL80': {'rated_vol': 77, 'rated_PSI': 3000},
-    '2xAL80': {'rated_vol': 154, 'rated_PSI': 3000},
-    # Additional tanks used by the notebook (approximate volumes and standard PSI)
-    'AL40': {'rated_vol': 40, 'rated_PSI': 3000},
-    '2xLP85': {'rated_vol': 170, 'rated_PSI': 2640},
-    '2xHP100': {'rated_vol': 200, 'rated_PSI': 3442},
-    '2xHP133': {'rated_vol': 266, 'rated_PSI': 3442},
+import numpy as np
+
+from gue_calc_kernels import (_calc_ata, _calc_bottom_time, _calc_ead, _calc_end,
+                              _calc_mg, _calc_mod, _calc_time_to_stop, _dive_profile)
+
+# Feet-of-water per atmosphere, hoisted to module scope so callers (and the
+# float-only kernels) see a single lookup instead of a string compare per call.
+_WATER_FACTOR: Dict[str, float] = {'salt': 33.0, 'fresh': 34.0}
+
+class UGMethod(IntEnum):
+    """Usable-gas partitioning: the divisor applied after reserving min gas.
+
+    Being an IntEnum, values pass straight into the float-only kernels
+    without a string lookup.
+    """
+    ALL = 1
+    HALF = 2
+    THIRDS = 3
+
+
+# String view of UGMethod, allocated once for name-based callers.
+_UG_METHODS: Dict[str, int] = {m.name: int(m) for m in UGMethod}
+
+
+def _resolve_ug_method(method: Union[str, int]) -> int:
+    """Map a method name/enum/divisor to its integer divisor."""
+    if isinstance(method, str):
+        if method not in _UG_METHODS:
+            raise KeyError(f'Unknown method: {method}; expected one of {list(_UG_METHODS)}')
+        return _UG_METHODS[method]
+    return int(method)
+
+
+# Tank definitions as parallel (structure-of-arrays) columns so cross-tank
+# queries run as single ufunc expressions. Volumes are approximate notebook
+# values at each tank's standard working pressure.
+_tank_names = np.array(['AL80', '2xAL80', 'AL40', '2xLP85', '2xHP100', '2xHP133'])
+_tank_vols = np.array([77, 154, 40, 170, 200, 266], dtype=np.float64)
+_tank_psis = np.array([3000, 3000, 3000, 2640, 3442, 3442], dtype=np.float64)
+# Tank factors (ft^3 per 100 PSI, nearest 0.5) — the array form of calcTF.
+_tank_tfs = np.round((_tank_vols / _tank_psis) * 100 * 2) / 2.0
+
+# Dict view of the same data, kept for tests, the notebook and name-based
+# lookups. Each entry gains precomputed 'tf'/'mg_psi_at_100ft' keys at import
+# time, below.
+tanks: Dict[str, Dict[str, float]] = {
+    # str() so the keys are plain Python strings, not np.str_ (which would
+    # leak into error messages listing the known tanks).
+    str(name): {'rated_vol': int(vol), 'rated_PSI': int(psi)}
+    for name, vol, psi in zip(_tank_names, _tank_vols, _tank_psis)
 }
 
 
@@ -30,9 +73,9 @@ def calcpTot(gasses: Iterable[float]) -> Optional[float]:
     Returns:
         The numeric sum, or ``None`` when the sum is greater than 100.
     """
-    total = 0.0
-    for g in gasses:
-        total += float(g)
+    # math.fsum is a single C-level (and exactly-rounded) reduction; it also
+    # consumes generators, so callers can pass any iterable of numbers.
+    total = math.fsum(gasses)
     return None if total > 100.0 else total
 
 # Example:
@@ -55,9 +98,13 @@ def calcpGas(ata: float, f_gas: float) -> float:
     return ata * f_gas
 
 
+@functools.lru_cache(maxsize=1024)
 def calcATA(depth: float, water: str = 'salt') -> float:
     """Return ATA at depth (rounded to 1 decimal).
 
+    Cached: planners sweep the same rounded depths repeatedly, so the small
+    working set makes repeat calls a dict hit.
+
     Formulae:
       - Salt water: ATA = 1 + depth/33
       - Fresh water: ATA = 1 + depth/34
@@ -66,8 +113,9 @@ def calcATA(depth: float, water: str = 'salt') -> float:
         depth: Depth in feet.
         water: 'salt' (default) or 'fresh'.
     """
-    divisor = 34.0 if water == 'fresh' else 33.0
-    return round((depth / divisor) + 1.0, 1)
+    # CPython's round() here: Numba's two-arg round is not correctly rounded,
+    # so the kernel returns the raw ATA and the wrapper owns the rounding.
+    return round(_calc_ata(float(depth), _WATER_FACTOR[water]), 1)
 
 # Example:
 # >>> calcATA(0)
@@ -103,9 +151,14 @@ def calcTimeToStop(depth: float, gas_switch_depth: float = 0) -> int:
     Returns:
         Total minutes (integer) for the ascent.
     """
-    if gas_switch_depth > 0:
-        return int(((depth - gas_switch_depth) / 10.0) + 2)
-    return int((depth / 10.0) + 1)
+    return _calc_time_to_stop(float(depth), float(gas_switch_depth))
+
+
+@functools.lru_cache(maxsize=256)
+def _calcMG_cached(depth: float, gas_switch_depth: float, c: float) -> int:
+    """Cache-friendly core of :func:`calcMG` (no ``verbose`` in the key)."""
+    ata_avg = (calcATA(depth) + calcATA(gas_switch_depth)) / 2.0
+    return _calc_mg(ata_avg, depth, gas_switch_depth, c)
 
 
 def calcMG(depth: float, gas_switch_depth: float = 0, c: float = 1.5, verbose: bool = False) -> int:
@@ -116,23 +169,27 @@ def calcMG(depth: float, gas_switch_depth: float = 0, c: float = 1.5, verbose: b
       - A is average ATA between start and gas switch,
       - T is estimated minutes to surface/switch.
 
-    Returns the value rounded to the nearest integer.
+    Returns the value rounded to the nearest integer. Dive tables revisit the
+    same few rounded depth/switch pairs, so the core result is memoized.
     """
-    a = (calcATA(depth) + calcATA(gas_switch_depth)) / 2.0
-    t = calcTimeToStop(depth, gas_switch_depth)
     if verbose:
+        a = (calcATA(depth) + calcATA(gas_switch_depth)) / 2.0
+        t = calcTimeToStop(depth, gas_switch_depth)
         print('Consumption:', c, 'Average ATA:', a, 'time:', t)
-    mg = c * a * t
-    return math.floor(mg + 0.5)
+    return _calcMG_cached(float(depth), float(gas_switch_depth), float(c))
 
 # Example:
 # >>> calcMG(100)
 # 41
 
 
+@functools.lru_cache(maxsize=64)
 def calcTF(rated_vol: float, rated_psi: float) -> float:
     """Tank factor: ft^3 per 100 PSI (rounded to nearest 0.5).
 
+    Cached: callers hit the same handful of (vol, PSI) pairs from ``tanks``,
+    so repeat calls are a dict lookup rather than arithmetic.
+
     Args:
         rated_vol: tank internal volume in ft^3.
         rated_psi: tank working pressure in PSI.
@@ -148,6 +205,16 @@ def calcPSI(tank_factor: float, gas_cf: float) -> int:
     return int(gas_cf / tank_factor) * 100
 
 
+# Precompute per-tank derived values once at import so hot paths
+# (calcBottomTime, the CLI tank command) read them as plain dict lookups:
+# 'tf' is the tank factor, 'mg_psi_at_100ft' the minimum-gas reserve in PSI
+# for the reference 100 ft dive.
+for _tank_info in tanks.values():
+    _tank_info['tf'] = calcTF(_tank_info['rated_vol'], _tank_info['rated_PSI'])
+    _tank_info['mg_psi_at_100ft'] = calcPSI(_tank_info['tf'], calcMG(100))
+del _tank_info
+
+
 def trimix_PO2(f_o2: float = 0.16, p: float = 3000.0) -> float:
     """Return O2 partial pressure in PSI for a trimix blend at pressure p."""
     return f_o2 * p
@@ -210,28 +277,53 @@ def calcGasVolCons(scr: float, ata: float, minutes: float) -> float:
     return scr * ata * minutes
 
 
-def calcUG(curr_psi: float = 3000.0, mg_psi: float = 500.0, method: str = 'ALL') -> float:
-    """Compute usable gas (PSI) after reserving minimum gas and partitioning."""
-    methods = {'ALL': 1, 'HALF': 2, 'THIRDS': 3}
-    if method not in methods:
-        raise KeyError(f'Unknown method: {method}; expected one of {list(methods)}')
-    return (curr_psi - mg_psi) / methods[method]
+def calcUG(curr_psi: float = 3000.0, mg_psi: float = 500.0,
+           method: Union[str, int] = 'ALL') -> float:
+    """Compute usable gas (PSI) after reserving minimum gas and partitioning.
+
+    ``method`` may be a name ('ALL', 'HALF', 'THIRDS'), a :class:`UGMethod`,
+    or the divisor itself when the caller has it resolved already.
+    """
+    return (curr_psi - mg_psi) / _resolve_ug_method(method)
 
 
-def calcBottomTime(depth: float = 100.0, tank: str = '2xAL80', method: str = 'ALL', scr: float = 1.5) -> float:
+def calcBottomTime(depth: float = 100.0, tank: str = '2xAL80',
+                   method: Union[str, int] = 'ALL', scr: float = 1.5) -> float:
     """Estimate bottom time available given tank, depth and SCR."""
-    ata = calcATA(depth)
     tank_info = tanks.get(tank)
     if tank_info is None:
         raise KeyError(f'Unknown tank: {tank}')
-    tf = calcTF(tank_info['rated_vol'], tank_info['rated_PSI'])
-    mg_cf = calcMG(depth, verbose=False)
-    mg_psi = calcPSI(tf, mg_cf)
-    ug = calcUG(tank_info['rated_PSI'], mg_psi, method=method)
-    # return minutes
+    divisor = _resolve_ug_method(method)
+    # Dict lookups and the rounded/cached ATA and min-gas values are resolved
+    # here; the remaining arithmetic runs in the JIT kernel.
+    return _calc_bottom_time(calcATA(depth), float(calcMG(depth)),
+                             float(tank_info['tf']), float(tank_info['rated_PSI']),
+                             float(scr), float(divisor))
+
+
+def calcBottomTime_all(depth: float = 100.0, method: Union[str, int] = 'ALL',
+                       scr: float = 1.5) -> np.ndarray:
+    """Bottom time for every known tank at once, aligned with ``tank_names``.
+
+    The vectorised analogue of calling :func:`calcBottomTime` per tank: one
+    ufunc pass over the parallel tank columns instead of a Python loop.
+    """
+    divisor = _resolve_ug_method(method)
+    ata = calcATA(depth)
+    mg_cf = calcMG(depth)
+    mg_psi = (mg_cf / _tank_tfs).astype(np.int64) * 100
+    ug = (_tank_psis - mg_psi) / divisor
     return ug / (scr * ata)
 
 
+def tank_names() -> np.ndarray:
+    """Tank names aligned with the rows of :func:`calcBottomTime_all`.
+
+    Returns a copy so callers cannot mutate the module-level column.
+    """
+    return _tank_names.copy()
+
+
 def O2_PSI_to_add(target_fraction_o2: float = 0.32, p: float = 3000.0) -> float:
     """PSI of O2 to add to achieve target FO2 (partial-pressure blending)."""
     return ((target_fraction_o2 - 0.21) / 0.79) * p
@@ -261,11 +353,7 @@ def calcMOD(f_o2: float, ppo2_limit: float = 1.4, water: str = 'salt') -> int:
         ppo2_limit: PPO2 limit in ATA (default 1.4).
         water: 'salt' or 'fresh'.
     """
-    if f_o2 <= 0:
-        return 0
-    factor = 34.0 if water == 'fresh' else 33.0
-    ata = ppo2_limit / f_o2
-    return int((ata - 1.0) * factor)
+    return _calc_mod(float(f_o2), float(ppo2_limit), _WATER_FACTOR[water])
 
 
 def calcEND(depth: float, f_he: float, water: str = 'salt') -> int:
@@ -274,12 +362,9 @@ def calcEND(depth: float, f_he: float, water: str = 'salt') -> int:
     Formula: END = (Depth + 33) * (1 - f_he) - 33.
     Treats O2 as narcotic (standard GUE approach).
     """
-    factor = 34.0 if water == 'fresh' else 33.0
-    ata = (depth / factor) + 1.0
-    # Effective narcotic ATA = Total ATA * (1 - Fraction of Helium)
-    # Since (1 - He) = N2 + O2.
-    narcotic_ata = ata * (1.0 - f_he)
-    return int((narcotic_ata - 1.0) * factor)
+    # Effective narcotic ATA = Total ATA * (1 - Fraction of Helium),
+    # since (1 - He) = N2 + O2; the arithmetic lives in the kernel.
+    return _calc_end(float(depth), float(f_he), _WATER_FACTOR[water])
 
 
 def calcEAD(depth: float, f_o2: float, water: str = 'salt') -> int:
@@ -288,17 +373,105 @@ def calcEAD(depth: float, f_o2: float, water: str = 'salt') -> int:
     Formula: EAD = ((Depth + 33) / 33) * (f_n2 / 0.79) * 33 - 33.
              Simplified: (ATA * (1 - f_o2) / 0.79 - 1) * 33.
     """
-    factor = 34.0 if water == 'fresh' else 33.0
-    ata = (depth / factor) + 1.0
-    f_n2 = 1.0 - f_o2
-    ead_ata = ata * (f_n2 / 0.79)
-    return int((ead_ata - 1.0) * factor)
+    return _calc_ead(float(depth), float(f_o2), _WATER_FACTOR[water])
+
+
+def calcpTot_vec(mixes: Iterable[Iterable[float]]) -> np.ndarray:
+    """Vectorised :func:`calcpTot` for a 2-D array of gas mixes.
+
+    Each row is one mix; returns the per-row totals with ``np.nan`` where a
+    total exceeds 100 (the array analogue of the scalar ``None``).
+    """
+    totals = np.asarray(mixes, dtype=np.float64).sum(axis=1)
+    return np.where(totals > 100.0, np.nan, totals)
+
+
+def calcTimeToStop_vec(depths: Iterable[float], gas_switch_depths: Iterable[float] = 0) -> np.ndarray:
+    """Vectorised :func:`calcTimeToStop` for arrays of depths/switch depths.
+
+    ``gas_switch_depths`` broadcasts, so a scalar 0 covers the no-switch case.
+    """
+    depths_arr = np.asarray(depths, dtype=np.float64)
+    switches = np.asarray(gas_switch_depths, dtype=np.float64)
+    has_switch = switches > 0
+    return (((depths_arr - has_switch * switches) / 10.0) + 1 + has_switch).astype(np.int64)
+
+
+def calcATA_vec(depths: Iterable[float], water: str = 'salt') -> np.ndarray:
+    """Vectorised :func:`calcATA` for an array of depths.
+
+    Accepts anything ``np.asarray`` understands (list, tuple, ndarray) and
+    returns an ``np.ndarray`` of ATA values rounded to 1 decimal, matching the
+    scalar function element-for-element.
+    """
+    depths_arr = np.asarray(depths, dtype=np.float64)
+    return np.round((depths_arr / _WATER_FACTOR[water]) + 1.0, 1)
+
+
+def calcMOD_vec(f_o2: Iterable[float], ppo2_limit: float = 1.4, water: str = 'salt') -> np.ndarray:
+    """Vectorised :func:`calcMOD` for an array of oxygen fractions.
+
+    Non-positive fractions yield 0, matching the scalar guard.
+    """
+    f_o2_arr = np.asarray(f_o2, dtype=np.float64)
+    factor = _WATER_FACTOR[water]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mod = ((ppo2_limit / f_o2_arr) - 1.0) * factor
+    return np.where(f_o2_arr > 0, mod, 0.0).astype(np.int64)
+
+
+def calcEND_vec(depths: Iterable[float], f_he: float, water: str = 'salt') -> np.ndarray:
+    """Vectorised :func:`calcEND` for an array of depths."""
+    depths_arr = np.asarray(depths, dtype=np.float64)
+    factor = _WATER_FACTOR[water]
+    ata = (depths_arr / factor) + 1.0
+    narcotic_ata = ata * (1.0 - f_he)
+    return ((narcotic_ata - 1.0) * factor).astype(np.int64)
+
+
+def calcEAD_vec(depths: Iterable[float], f_o2: float, water: str = 'salt') -> np.ndarray:
+    """Vectorised :func:`calcEAD` for an array of depths."""
+    depths_arr = np.asarray(depths, dtype=np.float64)
+    factor = _WATER_FACTOR[water]
+    ata = (depths_arr / factor) + 1.0
+    ead_ata = ata * ((1.0 - f_o2) / 0.79)
+    return ((ead_ata - 1.0) * factor).astype(np.int64)
+
+
+def dive_profile(depth: float, f_o2: float, f_he: float = 0.0,
+                 ppo2_limit: float = 1.4, water: str = 'salt') -> tuple[int, int, int]:
+    """Return (MOD, END, EAD) in feet for one depth/mix in a single kernel call.
+
+    Planners usually want all three numbers for the same dive; fusing them
+    computes the ambient ATA once instead of re-deriving it per function.
+    Results match :func:`calcMOD`/:func:`calcEND`/:func:`calcEAD` exactly.
+    """
+    return _dive_profile(float(depth), float(f_o2), float(f_he),
+                         float(ppo2_limit), _WATER_FACTOR[water])
+
+
+def dive_profile_vec(depths: Iterable[float], f_o2: float, f_he: float = 0.0,
+                     ppo2_limit: float = 1.4, water: str = 'salt') -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorised :func:`dive_profile`: three parallel arrays over ``depths``.
+
+    MOD depends only on the mix, so its array is constant across depths; it is
+    broadcast to the same shape to keep the three outputs aligned.
+    """
+    depths_arr = np.asarray(depths, dtype=np.float64)
+    factor = _WATER_FACTOR[water]
+    ata = (depths_arr / factor) + 1.0
+    mod = np.full(depths_arr.shape, calcMOD(f_o2, ppo2_limit, water), dtype=np.int64)
+    end = (((ata * (1.0 - f_he)) - 1.0) * factor).astype(np.int64)
+    ead = (((ata * ((1.0 - f_o2) / 0.79)) - 1.0) * factor).astype(np.int64)
+    return mod, end, ead
 
 
 __all__ = [
-    'tanks', 'calcpTot', 'calcpGas', 'calcATA', 'calcPPO2', 'calcTimeToStop', 'calcMG',
+    'tanks', 'UGMethod', 'calcpTot', 'calcpGas', 'calcATA', 'calcPPO2', 'calcTimeToStop', 'calcMG',
     'calcTF', 'calcPSI', 'trimix_PO2', 'trimix_P_He', 'nitrox_p', 'nitrox_FO2',
-    'calcMOD', 'calcEND', 'calcEAD'
+    'calcMOD', 'calcEND', 'calcEAD',
+    'calcpTot_vec', 'calcATA_vec', 'calcMOD_vec', 'calcEND_vec', 'calcEAD_vec',
+    'calcTimeToStop_vec', 'dive_profile', 'dive_profile_vec',
 ]
 
 
@@ -0,0 +1,21 @@
+"""Shared test setup: repo-root import path and the library fixture.
+
+Keeping the ``sys.path`` tweak here (conftest is imported before any test
+module is collected) lets the test modules import the project modules
+directly, and the session-scoped ``g`` fixture gives every test the same
+single import of :mod:`gue_calc_lib`.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import pytest
+
+
+@pytest.fixture(scope='session')
+def g():
+    """The gue_calc_lib module, imported once per test session."""
+    import gue_calc_lib
+    return gue_calc_lib
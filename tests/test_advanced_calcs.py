@@ -1,10 +1,7 @@
-import os
-import sys
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 import pytest
-import gue_calc_lib as g
 
-def test_calcMOD():
+
+def test_calcMOD(g):
     # Nitrox 32 @ 1.4 -> 111 ft. Conservative 100ft?
     # Formula: (1.4 / 0.32 - 1) * 33 = (4.375 - 1) * 33 = 3.375 * 33 = 111.375
     assert g.calcMOD(0.32) == 111
@@ -20,7 +17,7 @@ def test_calcMOD():
     # If code uses int(), it's conservative (shallower).
     assert g.calcMOD(1.0, ppo2_limit=1.6) == 19
 
-def test_calcEND():
+def test_calcEND(g):
     # Trimix 18/45 (18% O2, 45% He) at 150ft.
     # Salt water (33).
     # ATA = 150/33 + 1 = 4.54 + 1 = 5.54
@@ -34,7 +31,20 @@ def test_calcEND():
     # END = (100 + 33) * (1 - 0.30) - 33 = 133 * 0.70 - 33 = 93.1 - 33 = 60.1 -> 60ft.
     assert g.calcEND(100, 0.30) == 60
 
-def test_calcEAD():
+def test_dive_profile_matches_singles(g):
+    # 18/45 at 150ft: the fused call agrees with the three single functions.
+    mod, end, ead = g.dive_profile(150, 0.18, f_he=0.45)
+    assert mod == g.calcMOD(0.18)
+    assert end == g.calcEND(150, 0.45)
+    assert ead == g.calcEAD(150, 0.18)
+
+    mods, ends, eads = g.dive_profile_vec([100, 150], 0.18, f_he=0.45)
+    assert list(mods) == [g.calcMOD(0.18)] * 2
+    assert list(ends) == [g.calcEND(100, 0.45), g.calcEND(150, 0.45)]
+    assert list(eads) == [g.calcEAD(100, 0.18), g.calcEAD(150, 0.18)]
+
+
+def test_calcEAD(g):
     # EAD for Nitrox 32 at 100ft.
     # EAD = ((100 + 33) / 33) * (0.68 / 0.79) * 33 - 33
     #     = 4.03 * 0.86 * 33 - 33
@@ -1,10 +1,4 @@
-import os
-import sys
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-
-import gue_calc_lib as g
-
-def test_calcATA_fresh_water():
+def test_calcATA_fresh_water(g):
     # 34 feet fresh water = 2 ATA
     assert g.calcATA(34, water='fresh') == 2.0
     # 0 feet = 1 ATA
@@ -0,0 +1,48 @@
+import contextlib
+import io
+import os
+import subprocess
+import sys
+
+import pytest
+import gue_calc_cli as cli
+
+CLI = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'gue_calc_cli.py')
+
+
+def run_cli(*args):
+    """Invoke the CLI in-process and return captured stdout."""
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        cli.main(list(args))
+    return out.getvalue()
+
+
+def test_min_gas_single_depth():
+    assert run_cli('min_gas', '100').strip() == '41'
+
+
+def test_min_gas_comma_list():
+    lines = run_cli('min_gas', '60,100').strip().splitlines()
+    assert len(lines) == 2
+    assert lines[0].startswith('60 ft:')
+    assert lines[1].startswith('100 ft:')
+
+
+def test_mod():
+    assert run_cli('mod', '0.32').strip() == '111'
+
+
+def test_tank_known_and_unknown():
+    assert 'tank factor 2.5' in run_cli('tank', 'AL80')
+
+    with pytest.raises(SystemExit):
+        run_cli('tank', 'NONEXISTENT')
+
+
+def test_subprocess_smoke():
+    # Single end-to-end check that the script still works as a script.
+    result = subprocess.run([sys.executable, CLI, 'min_gas', '100'],
+                            capture_output=True, text=True)
+    assert result.returncode == 0
+    assert result.stdout.strip() == '41'
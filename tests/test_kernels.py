@@ -0,0 +1,43 @@
+import gue_calc_kernels as k
+
+
+def test_kernels_match_public_helpers(g):
+    for depth in (0.0, 33.0, 70.0, 100.0, 150.0):
+        assert round(k._calc_ata(depth, 33.0), 1) == g.calcATA(depth)
+        assert k._calc_time_to_stop(depth, 0.0) == g.calcTimeToStop(depth)
+    assert k._calc_mg(2.5, 100.0, 0.0, 1.5) == 41
+
+
+def test_calcATA_sweep_matches_baseline_formula(g):
+    # The kernel must not change rounding versus the original pure-Python
+    # formula, for either water type, across a whole dive-table sweep.
+    depths = [d / 10.0 for d in range(0, 4001, 3)]
+    for depth in depths:
+        assert g.calcATA(depth) == round((depth / 33.0) + 1.0, 1)
+        assert g.calcATA(depth, water='fresh') == round((depth / 34.0) + 1.0, 1)
+    # Cases that diverged under Numba's two-argument round():
+    assert g.calcATA(5) == 1.2
+    assert g.calcATA(18.7, water='fresh') == 1.5
+
+
+def test_end_ead_mod_kernels_match_baseline_formula(g):
+    # int() truncation sits at exact whole-foot boundaries (e.g. END at 7 ft
+    # on 30% He is exactly -5.0), so the kernels must reproduce the baseline
+    # arithmetic bit-for-bit across depths and mixes.
+    mixes = [(0.21, 0.0), (0.32, 0.0), (0.18, 0.45), (0.30, 0.30), (0.21, 0.35), (1.0, 0.0)]
+    for depth in range(0, 401):
+        for f_o2, f_he in mixes:
+            ata = (depth / 33.0) + 1.0
+            assert g.calcEND(depth, f_he) == int((ata * (1.0 - f_he) - 1.0) * 33.0)
+            assert g.calcEAD(depth, f_o2) == int((ata * ((1.0 - f_o2) / 0.79) - 1.0) * 33.0)
+            assert g.calcMOD(f_o2) == int(((1.4 / f_o2) - 1.0) * 33.0)
+            assert g.dive_profile(depth, f_o2, f_he) == (
+                g.calcMOD(f_o2), g.calcEND(depth, f_he), g.calcEAD(depth, f_o2))
+    assert g.calcEND(7, 0.3) == -4
+
+
+def test_calcBottomTime_kernel_path(g):
+    # 2xAL80 at 100ft, ALL: tf=5.0, mg=41cf -> 800psi reserved, ug=2200psi
+    minutes = g.calcBottomTime(depth=100, tank='2xAL80')
+    assert minutes > 0
+    assert minutes == k._calc_bottom_time(4.0, 41.0, 5.0, 3000.0, 1.5, 1.0)
@@ -1,10 +1,7 @@
-import os
-import sys
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+import pytest
 
-import gue_calc_lib as g
 
-def test_tank_factors_new_defs():
+def test_tank_factors_new_defs(g):
     # 2xHP100: 200cf @ 3442.
     # TF = (200 / 3442) * 100 * 2 = 11.62... round -> 12. / 2 = 6.0
     tf_hp100 = g.calcTF(200, 3442)
@@ -19,3 +16,17 @@ def test_tank_factors_new_defs():
     # TF = (154 / 3000) * 100 * 2 = 10.26... round -> 10. / 2 = 5.0
     tf_al80_d = g.calcTF(154, 3000)
     assert tf_al80_d == 5.0
+
+
+def test_soa_columns_match_dict(g):
+    # The parallel arrays and the dict view describe the same tanks, and the
+    # dict view keeps plain-str keys.
+    for name, tf in zip(g.tank_names(), g._tank_tfs):
+        assert g.tanks[name]['tf'] == tf
+    assert all(type(key) is str for key in g.tanks)
+
+
+def test_calcBottomTime_all_matches_scalar(g):
+    all_times = g.calcBottomTime_all(depth=100)
+    for name, minutes in zip(g.tank_names(), all_times):
+        assert minutes == pytest.approx(g.calcBottomTime(depth=100, tank=name))
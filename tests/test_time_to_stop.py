@@ -1,9 +1,4 @@
-import os
-import sys
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-import gue_calc_lib as g
-
-def test_calcTimeToStop_gue_heuristic():
+def test_calcTimeToStop_gue_heuristic(g):
     # 100ft -> Surface.
     # 100/10 = 10 min ascent. + 1 min solve = 11.
     assert g.calcTimeToStop(100) == 11
@@ -18,3 +13,9 @@ def test_calcTimeToStop_gue_heuristic():
     # +1 min solve + 1 min switch = +2.
     # Total 5.
     assert g.calcTimeToStop(100, gas_switch_depth=70) == 5
+
+
+def test_calcTimeToStop_vec_matches_scalar(g):
+    # Same three cases, evaluated in one vectorised call.
+    result = g.calcTimeToStop_vec([100, 30, 100], [0, 0, 70])
+    assert list(result) == [11, 4, 5]
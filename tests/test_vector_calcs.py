@@ -0,0 +1,37 @@
+import numpy as np
+
+
+def test_calcpTot_vec(g):
+    mixes = [[21, 35, 44], [60, 50, 0], [0.21, 0.35, 0.44]]
+    totals = g.calcpTot_vec(mixes)
+    assert totals[0] == 100.0
+    assert np.isnan(totals[1])  # > 100 -> nan, like scalar None
+    assert np.isclose(totals[2], 1.0)
+
+
+def test_calcATA_vec_matches_scalar(g):
+    depths = [0, 33, 66, 100, 150]
+    expected = [g.calcATA(d) for d in depths]
+    assert np.allclose(g.calcATA_vec(depths), expected)
+    # fresh water branch
+    assert np.allclose(g.calcATA_vec([34], water='fresh'), [2.0])
+
+
+def test_calcMOD_vec_matches_scalar(g):
+    fractions = [0.21, 0.32, 0.50, 1.0]
+    expected = [g.calcMOD(f) for f in fractions]
+    assert list(g.calcMOD_vec(fractions)) == expected
+    # non-positive fraction guard matches scalar behaviour
+    assert list(g.calcMOD_vec([0.0, 0.32])) == [0, g.calcMOD(0.32)]
+
+
+def test_calcEND_vec_matches_scalar(g):
+    depths = [100, 150, 200]
+    expected = [g.calcEND(d, 0.45) for d in depths]
+    assert list(g.calcEND_vec(depths, 0.45)) == expected
+
+
+def test_calcEAD_vec_matches_scalar(g):
+    depths = [60, 100, 130]
+    expected = [g.calcEAD(d, 0.32) for d in depths]
+    assert list(g.calcEAD_vec(depths, 0.32)) == expected